@@ -0,0 +1,32 @@
+import base64
+import hashlib
+from functools import lru_cache
+from html import escape
+
+AVATAR_COLORS = ["#4A90E2", "#6BCB77", "#FF6B6B", "#FF8C42", "#9B59B6", "#2E7D32", "#F57C00", "#C62828"]
+
+
+def _initials(name: str) -> str:
+    parts = [p for p in name.replace("_", " ").split() if p]
+    if not parts:
+        return "?"
+    if len(parts) == 1:
+        return parts[0][:2].upper()
+    return (parts[0][0] + parts[-1][0]).upper()
+
+
+@lru_cache(maxsize=1024)
+def avatar_data_uri(name: str, size: int = 128) -> str:
+    # Deterministic background per name so the same student always gets the same color
+    digest = hashlib.md5(name.encode("utf-8")).digest()
+    background = AVATAR_COLORS[digest[0] % len(AVATAR_COLORS)]
+
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {size} {size}">'
+        f'<rect width="100%" height="100%" fill="{background}"/>'
+        f'<text x="50%" y="50%" dy=".35em" text-anchor="middle" fill="white" '
+        f'font-family="Arial, Helvetica, sans-serif" font-size="{size * 0.4:.0f}" font-weight="600">'
+        f"{escape(_initials(name))}</text></svg>"
+    )
+    encoded = base64.b64encode(svg.encode("utf-8")).decode("ascii")
+    return f"data:image/svg+xml;base64,{encoded}"
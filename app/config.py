@@ -1,6 +1,11 @@
+import os
+
 APP_TITLE = "School Performance Dashboard"
-CSV_PATH = "Students_Dataset.csv"
+# STUDENTS_CSV_PATH lets the same app serve another dataset (used by load_test.py)
+CSV_PATH = os.environ.get("STUDENTS_CSV_PATH", "Students_Dataset.csv")
 PASSING_SCORE = 60
+SPI_MODEL_PATH = "spi_model.json"
+QUARANTINE_INVALID_ROWS = True
 
 PALETTE = {
     "blue": "#4A90E2",
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from app.config import CSV_PATH, PASSING_SCORE
+from app.metrics import compute_pass_metrics
 
 
 @st.cache_data
@@ -15,15 +16,16 @@ def preprocess(df: pd.DataFrame) -> pd.DataFrame:
         if col in df.columns:
             df[col] = df[col].astype(str).str.strip()
 
-    df["is_passing"] = df["assessment_score"] >= PASSING_SCORE
-    df["engagement_score"] = df["raised_hand_count"] + df["moodle_views"] + df["resources_downloads"]
+    df["engagement_score"] = pd.to_numeric(
+        df["raised_hand_count"] + df["moodle_views"] + df["resources_downloads"], downcast="integer"
+    )
 
     return df
 
 
-def compute_overall_metrics(df: pd.DataFrame) -> dict:
+def compute_overall_metrics(df: pd.DataFrame, passing_score: float = PASSING_SCORE) -> dict:
     overall_avg = df["assessment_score"].mean()
-    pass_rate = (df.groupby("student_id")["is_passing"].mean() * 100).mean()
+    pass_rate = compute_pass_metrics(df, passing_score)["course_pass_rate"]
     fail_rate = 100 - pass_rate
     avg_attendance = df["attendance_rate"].mean()
 
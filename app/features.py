@@ -0,0 +1,72 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+
+def course_matrix(df: pd.DataFrame) -> dict:
+    student_codes, student_ids = pd.factorize(df["student_id"], sort=True)
+    course_codes, courses = pd.factorize(df["course_name"], sort=True)
+    n_students, n_courses = len(student_ids), len(courses)
+
+    # factorize codes missing keys as -1; those rows belong to no cell and are skipped
+    keep = (student_codes >= 0) & (course_codes >= 0)
+    if not keep.all():
+        df = df[keep]
+        student_codes, course_codes = student_codes[keep], course_codes[keep]
+
+    # Flat (student, course) cell per row; every statistic is a bincount over it
+    cell = student_codes * n_courses + course_codes
+    size = n_students * n_courses
+    counts = np.bincount(cell, minlength=size)
+
+    def cell_mean(values) -> np.ndarray:
+        sums = np.bincount(cell, weights=np.asarray(values, dtype=float), minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (sums / counts).reshape(n_students, n_courses)  # NaN where not enrolled
+
+    # preprocess already stores the per-row total; raw frames fall back to summing the parts
+    if "engagement_score" in df:
+        engagement = df["engagement_score"]
+    else:
+        engagement = df["raised_hand_count"] + df["moodle_views"] + df["resources_downloads"]
+
+    student_ids = np.asarray(student_ids)
+    courses = np.asarray(courses)
+    return {
+        "student_ids": student_ids,
+        "courses": courses,
+        "student_index": {sid: row for row, sid in enumerate(student_ids.tolist())},
+        "course_index": {name: col for col, name in enumerate(courses.tolist())},
+        "score": cell_mean(df["assessment_score"]),
+        "attendance": cell_mean(df["attendance_rate"]),
+        "engagement": cell_mean(engagement),
+        "count": counts.reshape(n_students, n_courses).astype(np.int32),
+    }
+
+
+@st.cache_data
+def build_course_matrix(df: pd.DataFrame) -> dict:
+    return course_matrix(df)
+
+
+def matrix_rows(matrix: dict, feature: str, student_ids) -> np.ndarray:
+    # Rows of a feature in the order of student_ids; students missing from the matrix get NaN
+    rows = pd.Index(matrix["student_ids"]).get_indexer(student_ids)
+    values = matrix[feature][rows].astype(float)
+    values[rows < 0] = np.nan
+    return values
+
+
+def course_means(matrix: dict, feature: str = "score") -> pd.Series:
+    # Assessment-weighted average per course, same as a groupby mean over the raw rows
+    counts = matrix["count"]
+    totals = np.where(counts > 0, matrix[feature], 0.0) * counts
+    return pd.Series(totals.sum(axis=0) / counts.sum(axis=0), index=matrix["courses"], name=feature)
+
+
+def student_course_row(matrix: dict, student_id, feature: str = "score") -> pd.Series:
+    row = matrix["student_index"].get(student_id)
+    if row is None:
+        return pd.Series(dtype=float, name=feature)
+    enrolled = matrix["count"][row] > 0
+    return pd.Series(matrix[feature][row][enrolled], index=matrix["courses"][enrolled], name=feature)
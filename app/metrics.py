@@ -0,0 +1,44 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from app.config import PASSING_SCORE
+from app.features import build_course_matrix
+
+
+@st.cache_data
+def compute_pass_metrics(df: pd.DataFrame, passing_score: int = PASSING_SCORE) -> dict:
+    # Course-level rates come from the shared student x course matrix; no extra grouping here
+    matrix = build_course_matrix(df)
+    counts = matrix["count"]
+    enrolled = counts > 0
+    course_passed = enrolled & (np.nan_to_num(matrix["score"], nan=-np.inf) >= passing_score)
+
+    score_totals = (np.where(enrolled, matrix["score"], 0.0) * counts).sum(axis=1)
+    assessments = counts.sum(axis=1)
+    has_scores = assessments > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_score = score_totals / assessments
+
+    per_student = pd.DataFrame(
+        {
+            "avg_score": avg_score,
+            "passing_courses": course_passed.sum(axis=1).astype(int),
+            "total_courses": enrolled.sum(axis=1).astype(int),
+        },
+        index=pd.Index(matrix["student_ids"], name="student_id"),
+    )
+
+    scores = df["assessment_score"].dropna()
+
+    def _rate(passed, total) -> float:
+        return float(passed) / float(total) * 100 if total else 0.0
+
+    return {
+        # Share of individual assessments scored at or above the passing score
+        "assessment_pass_rate": _rate((scores >= passing_score).sum(), len(scores)),
+        # Share of students whose overall average passes
+        "student_pass_rate": _rate((avg_score[has_scores] >= passing_score).sum(), has_scores.sum()),
+        # Share of (student, course) enrollments whose course average passes, as in spi.py
+        "course_pass_rate": _rate(course_passed.sum(), enrolled.sum()),
+        "student_courses": per_student,
+    }
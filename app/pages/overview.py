@@ -2,16 +2,19 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 
-from app.config import PASSING_SCORE, PALETTE
+from app.config import PALETTE
 from app.ui import kpi_card
 from app.data import compute_overall_metrics
+from app.features import build_course_matrix, course_means
 from app.charts import bar_chart
+from app.spi_model import DEFAULT_SPI_MODEL, SPIModel
 
 
-def render_overview(df: pd.DataFrame, show_header: bool = True):
+def render_overview(df: pd.DataFrame, show_header: bool = True, spi_model: SPIModel = DEFAULT_SPI_MODEL):
     # show_header kept for flexibility, but main.py already shows global header
     # so here we usually call with show_header=False
-    metrics = compute_overall_metrics(df)
+    passing_score = spi_model.passing_score
+    metrics = compute_overall_metrics(df, passing_score)
 
     st.header("Performance Overview")
     c1, c2, c3, c4 = st.columns(4)
@@ -64,8 +67,8 @@ def render_overview(df: pd.DataFrame, show_header: bool = True):
             height=400,
             y_range=[0, max(1, class_perf["assessment_score"].max() * 1.15)],
         )
-        fig.add_hline(y=PASSING_SCORE, line_dash="dash", line_color="red",
-                      annotation_text="Passing (60)", annotation_position="right")
+        fig.add_hline(y=passing_score, line_dash="dash", line_color="red",
+                      annotation_text=f"Passing ({passing_score:g})", annotation_position="right")
         st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("---")
@@ -112,7 +115,11 @@ def render_overview(df: pd.DataFrame, show_header: bool = True):
 
     with col2:
         st.subheader("Average Score by Course")
-        course_avg = df.groupby("course_name")["assessment_score"].mean().reset_index()
+        course_avg = (
+            course_means(build_course_matrix(df))
+            .rename_axis("course_name")
+            .reset_index(name="assessment_score")
+        )
         course_avg = course_avg.sort_values("assessment_score", ascending=False)
 
         colors = [PALETTE["orange"], "#50C878", PALETTE["purple"], PALETTE["blue"], PALETTE["yellow"]]
@@ -2,13 +2,14 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 
-from app.config import PASSING_SCORE, PALETTE
-from app.spi import build_student_spi_table, calculate_student_performance_index
+from app.config import PALETTE
+from app.spi import STATUS_COLORS, build_student_spi_table
+from app.spi_model import DEFAULT_SPI_MODEL, SPIModel
 from app.charts import bar_chart
 
 
-def render_risk(df: pd.DataFrame):
-    student_avg = build_student_spi_table(df)
+def render_risk(df: pd.DataFrame, spi_model: SPIModel = DEFAULT_SPI_MODEL):
+    student_avg = build_student_spi_table(df, spi_model)
 
     st.header("Risk Overview")
     col1, col2 = st.columns(2)
@@ -41,16 +42,9 @@ def render_risk(df: pd.DataFrame):
     with col2:
         st.subheader("Overall Student Status")
         status_counts = student_avg["status"].value_counts()
-        order = ["EXCELLENT", "SATISFACTORY", "AT RISK", "CRITICAL"]
-        labels = [s for s in order if s in status_counts.index]
+        labels = [s for s in spi_model.statuses if s in status_counts.index]
         values = [int(status_counts[s]) for s in labels]
-        colors_map = {
-            "EXCELLENT": PALETTE["dark_green"],
-            "SATISFACTORY": PALETTE["amber"],
-            "AT RISK": PALETTE["deep_orange"],
-            "CRITICAL": PALETTE["dark_red"],
-        }
-        colors = [colors_map[s] for s in labels]
+        colors = [STATUS_COLORS.get(s, PALETTE["blue"]) for s in labels]
 
         fig = go.Figure(data=[go.Pie(labels=labels, values=values, marker=dict(colors=colors),
                                      hole=0.5, textinfo="label+value+percent")])
@@ -76,7 +70,7 @@ def render_risk(df: pd.DataFrame):
                 continue
 
             st.markdown("**Students classified as AT RISK or CRITICAL based on SPI:**")
-            st.markdown("- SPI < 65 (academics + attendance + engagement + failures + trends)")
+            st.markdown(f"- SPI < {spi_model.at_risk_below:g} (academics + attendance + engagement + failures + trends)")
             st.markdown("")
 
             for _, student in at_risk_students.iterrows():
@@ -93,20 +87,17 @@ def render_risk(df: pd.DataFrame):
                         st.markdown("**Engagement**")
                         st.markdown(f"{student['raised_hand_count']:.0f}")
 
-                    sdata = df[df["student_id"] == student["student_id"]]
-                    _, _, _, details = calculate_student_performance_index(sdata, PASSING_SCORE)
-
                     st.markdown("**Contributing Factors:**")
-                    if student["assessment_score"] < PASSING_SCORE:
-                        st.markdown(f"- Failing average (below {PASSING_SCORE})")
+                    if student["assessment_score"] < spi_model.passing_score:
+                        st.markdown(f"- Failing average (below {spi_model.passing_score:g})")
                     if student["attendance_rate"] < 70:
                         st.markdown("- Low attendance")
                     if student["raised_hand_count"] < 10:
                         st.markdown("- Minimal engagement")
-                    if details["failed_courses"] > 0:
-                        st.markdown(f"- Failing {details['failed_courses']} course(s)")
-                    if details["trend_penalty"] > 0:
-                        st.markdown(f"- Declining trend ({details['performance_trend']:.1f} point drop)")
+                    if student["failed_courses"] > 0:
+                        st.markdown(f"- Failing {int(student['failed_courses'])} course(s)")
+                    if student["trend_penalty"] > 0:
+                        st.markdown(f"- Declining trend ({student['performance_trend']:.1f} point drop)")
 
     st.markdown("---")
 
@@ -0,0 +1,84 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from app.spi_model import DEFAULT_SPI_MODEL, SPIModel
+from app.simulation import SIMULATION_PARAMETERS, run_simulation
+
+MAX_SCENARIOS = 500
+
+PARAMETER_LABELS = {
+    "passing_score": "Passing Score",
+    "academic_weight": "Academic Weight",
+    "attendance_weight": "Attendance Weight",
+    "engagement_weight": "Engagement Weight",
+    "engagement_target": "Engagement Target (raised hands)",
+    "trend_drop_threshold": "Trend Drop Threshold",
+    "trend_penalty": "Trend Penalty",
+}
+
+
+def _parse_values(text: str) -> list:
+    return [float(v) for v in text.replace(";", ",").split(",") if v.strip()]
+
+
+def render_simulation(df: pd.DataFrame, spi_model: SPIModel = DEFAULT_SPI_MODEL):
+
+    st.header("What-If Simulation")
+    st.markdown(
+        "Enter one or more comma-separated values per parameter. Every combination is scored "
+        f"against the whole cohort using SPI model **{spi_model.version}** for everything else."
+    )
+
+    grid = {}
+    cols = st.columns(4)
+    for i, name in enumerate(SIMULATION_PARAMETERS):
+        with cols[i % 4]:
+            text = st.text_input(PARAMETER_LABELS[name], value=f"{getattr(spi_model, name):g}", key=f"sim_{name}")
+        try:
+            grid[name] = _parse_values(text)
+        except ValueError:
+            st.error(f"{PARAMETER_LABELS[name]}: please enter numbers separated by commas.")
+            return
+
+    if any(v <= 0 for v in grid["engagement_target"]):
+        st.error(f"{PARAMETER_LABELS['engagement_target']} must be greater than 0.")
+        return
+    for name in ["academic_weight", "attendance_weight", "engagement_weight"]:
+        if any(v < 0 for v in grid[name]):
+            st.error(f"{PARAMETER_LABELS[name]} must not be negative.")
+            return
+
+    n_scenarios = 1
+    for values in grid.values():
+        n_scenarios *= max(1, len(set(values)))
+    if n_scenarios > MAX_SCENARIOS:
+        st.warning(f"{n_scenarios} scenarios requested; please narrow the grid to at most {MAX_SCENARIOS}.")
+        return
+
+    results = run_simulation(df, spi_model, grid)
+
+    st.markdown("---")
+    st.subheader("At-Risk Students by Scenario")
+
+    fig = go.Figure()
+    for scenario, rows in results.groupby("scenario", sort=False):
+        fig.add_trace(go.Bar(name=scenario, x=rows["class_level"], y=rows["at_risk"], text=rows["at_risk"],
+                             textposition="outside"))
+    fig.update_layout(
+        barmode="group",
+        height=400,
+        xaxis_title="Class Level",
+        yaxis_title="Students at Risk",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=40, r=40, t=40, b=60),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("Status Counts per Class Level")
+    status_cols = [c for c in results.columns if c not in SIMULATION_PARAMETERS and c != "scenario"]
+    st.dataframe(results[["scenario"] + status_cols], use_container_width=True, hide_index=True)
+
+    totals = results.groupby("scenario", sort=False)[status_cols[1:]].sum().reset_index()
+    st.subheader("Cohort Totals")
+    st.dataframe(totals, use_container_width=True, hide_index=True)
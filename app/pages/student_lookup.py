@@ -2,11 +2,14 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 
-from app.config import PASSING_SCORE
 from app.spi import calculate_student_performance_index
+from app.spi_model import DEFAULT_SPI_MODEL, SPIModel
+from app.metrics import compute_pass_metrics
+from app.avatars import avatar_data_uri
+from app.features import build_course_matrix, student_course_row
 
 
-def render_student_lookup(df: pd.DataFrame):
+def render_student_lookup(df: pd.DataFrame, spi_model: SPIModel = DEFAULT_SPI_MODEL):
     st.header("Student Performance Lookup")
 
     st.markdown("### Search by ID")
@@ -50,13 +53,14 @@ def render_student_lookup(df: pd.DataFrame):
     class_level = student_data.iloc[0]["class_level"]
     gender = student_data.iloc[0].get("student_gender", "N/A")
 
-    spi_score, status, status_color, spi_details = calculate_student_performance_index(student_data, PASSING_SCORE)
+    passing_score = spi_model.passing_score
+    spi_score, status, status_color, spi_details = calculate_student_performance_index(student_data, model=spi_model)
 
-    courses_perf = student_data.groupby("course_name")["assessment_score"].mean()
-    passing_courses = int((courses_perf >= PASSING_SCORE).sum())
-    total_courses = int(len(courses_perf))
+    course_counts = compute_pass_metrics(df, passing_score)["student_courses"].loc[student_id]
+    passing_courses = int(course_counts["passing_courses"])
+    total_courses = int(course_counts["total_courses"])
 
-    avatar_url = f"https://ui-avatars.com/api/?name={student_name}&background=random&size=128"
+    avatar_url = avatar_data_uri(student_name)
 
     st.markdown(
         f"""
@@ -136,9 +140,9 @@ def render_student_lookup(df: pd.DataFrame):
         st.markdown(
             f"""
             **Base Components:**
-            - Academic (60%): {spi_details['academic_component']:.1f} points
-            - Attendance (25%): {spi_details['attendance_component']:.1f} points
-            - Engagement (15%): {spi_details['engagement_component']:.1f} points
+            - Academic ({spi_model.academic_weight:.0%}): {spi_details['academic_component']:.1f} points
+            - Attendance ({spi_model.attendance_weight:.0%}): {spi_details['attendance_component']:.1f} points
+            - Engagement ({spi_model.engagement_weight:.0%}): {spi_details['engagement_component']:.1f} points
             - **Base SPI**: {spi_details['base_spi']:.1f} points
             """
         )
@@ -159,7 +163,11 @@ def render_student_lookup(df: pd.DataFrame):
 
     with left:
         st.subheader("📚 Course Breakdown")
-        course_perf = student_data.groupby("course_name")["assessment_score"].mean().reset_index()
+        course_perf = (
+            student_course_row(build_course_matrix(df), student_id)
+            .rename_axis("course_name")
+            .reset_index(name="assessment_score")
+        )
         course_perf = course_perf.sort_values("assessment_score", ascending=False)
 
         fig = go.Figure(
@@ -170,11 +178,11 @@ def render_student_lookup(df: pd.DataFrame):
                     text=course_perf["assessment_score"].round(1),
                     textposition="outside",
                     textfont=dict(size=12, color="#1f1f1f"),
-                    marker_color=["#4CAF50" if s >= PASSING_SCORE else "#EF5350" for s in course_perf["assessment_score"]],
+                    marker_color=["#4CAF50" if s >= passing_score else "#EF5350" for s in course_perf["assessment_score"]],
                 )
             ]
         )
-        fig.add_hline(y=PASSING_SCORE, line_dash="dash", line_color="red", annotation_text="Passing Line")
+        fig.add_hline(y=passing_score, line_dash="dash", line_color="red", annotation_text="Passing Line")
         fig.update_layout(height=350, showlegend=False, xaxis_title="Course", yaxis_title="Average Score",
                           margin=dict(l=40, r=40, t=40, b=60))
         st.plotly_chart(fig, use_container_width=True)
@@ -197,10 +205,10 @@ def render_student_lookup(df: pd.DataFrame):
             insights.append("✅ **Strong Academics**: Consistently scoring above 80%")
         elif avg_score >= 70:
             insights.append("✅ **Good Academic Standing**: Maintaining solid grades")
-        elif avg_score >= PASSING_SCORE:
+        elif avg_score >= passing_score:
             insights.append("⚠️ **Borderline Performance**: Scores just above passing threshold")
         else:
-            insights.append(f"🚨 **Academic Emergency**: Failing average (below {PASSING_SCORE})")
+            insights.append(f"🚨 **Academic Emergency**: Failing average (below {passing_score:g})")
 
         if avg_attendance >= 90:
             insights.append("✅ **Excellent Attendance**: Rarely misses class")
@@ -224,7 +232,7 @@ def render_student_lookup(df: pd.DataFrame):
             insights.append(f"📈 **Improving Trend**: Performance increased by {spi_details['performance_trend']:.1f} points!")
 
         if spi_details["failed_courses"] > 0:
-            weak = course_perf[course_perf["assessment_score"] < PASSING_SCORE]
+            weak = course_perf[course_perf["assessment_score"] < passing_score]
             insights.append(f"📚 **Failing {spi_details['failed_courses']} Course(s)**: {', '.join(weak['course_name'].tolist())}")
 
         strong = course_perf[course_perf["assessment_score"] >= 80]
@@ -0,0 +1,71 @@
+import itertools
+import streamlit as st
+import numpy as np
+import pandas as pd
+from app.spi import compute_spi_components, score_spi
+from app.spi_model import SPIModel
+
+SIMULATION_PARAMETERS = [
+    "passing_score",
+    "academic_weight",
+    "attendance_weight",
+    "engagement_weight",
+    "engagement_target",
+    "trend_drop_threshold",
+    "trend_penalty",
+]
+
+SCENARIO_CHUNK = 8
+
+
+def build_scenarios(model: SPIModel, grid: dict) -> pd.DataFrame:
+    unknown = set(grid) - set(SIMULATION_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Cannot simulate: {', '.join(sorted(unknown))}")
+
+    # Repeated values would produce identical scenarios, so keep the first of each
+    values = [list(dict.fromkeys(float(v) for v in (grid.get(p) or [getattr(model, p)]))) for p in SIMULATION_PARAMETERS]
+    scenarios = pd.DataFrame(list(itertools.product(*values)), columns=SIMULATION_PARAMETERS, dtype=float)
+
+    varied = [p for p, v in zip(SIMULATION_PARAMETERS, values) if len(v) > 1]
+    if varied:
+        scenarios.insert(0, "scenario", scenarios[varied].apply(
+            lambda row: ", ".join(f"{p}={row[p]:g}" for p in varied), axis=1
+        ))
+    else:
+        scenarios.insert(0, "scenario", "baseline")
+    return scenarios
+
+
+@st.cache_data(max_entries=32)
+def run_simulation(df: pd.DataFrame, model: SPIModel, grid: dict) -> pd.DataFrame:
+    # Cached per (data, model, grid) so reruns triggered by other tabs do not rescore the grid
+    return simulate_status_counts(compute_spi_components(df), model, grid)
+
+
+def simulate_status_counts(components: dict, model: SPIModel, grid: dict) -> pd.DataFrame:
+    scenarios = build_scenarios(model, grid)
+    students = components["students"]
+
+    statuses = model.statuses
+    class_codes, class_levels = pd.factorize(students["class_level"], sort=True)
+    n_scenarios, n_classes, n_statuses = len(scenarios), len(class_levels), len(statuses)
+
+    # Score a block of scenarios at a time so only (block, students) arrays are ever alive,
+    # then count (scenario, class level, status) cells of the block with one bincount
+    counts = []
+    for start in range(0, n_scenarios, SCENARIO_CHUNK):
+        block = scenarios.iloc[start:start + SCENARIO_CHUNK]
+        params = {name: block[name].to_numpy() for name in SIMULATION_PARAMETERS}
+        status_idx = score_spi(components, model, params, status_only=True)["status_idx"]
+        cell = (np.arange(len(block))[:, None] * n_classes + class_codes) * n_statuses + status_idx
+        counts.append(np.bincount(cell.ravel(), minlength=len(block) * n_classes * n_statuses))
+    counts = np.concatenate(counts).reshape(n_scenarios * n_classes, n_statuses)
+
+    result = pd.DataFrame(counts, columns=statuses)
+    result.insert(0, "class_level", np.tile(np.asarray(class_levels), n_scenarios))
+    result = pd.concat(
+        [scenarios.loc[scenarios.index.repeat(n_classes)].reset_index(drop=True), result], axis=1
+    )
+    result["at_risk"] = result[[s for s in statuses if s in model.at_risk_statuses]].sum(axis=1)
+    return result
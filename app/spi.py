@@ -1,61 +1,107 @@
+import streamlit as st
+import numpy as np
 import pandas as pd
-from app.config import PASSING_SCORE, PALETTE
+from dataclasses import replace
+from functools import lru_cache
+from app.config import PALETTE
+from app.features import build_course_matrix, course_matrix, matrix_rows
+from app.spi_model import SPIModel, active_spi_model
+
+STATUS_COLORS = {
+    "EXCELLENT": PALETTE["dark_green"],
+    "SATISFACTORY": PALETTE["amber"],
+    "AT RISK": PALETTE["deep_orange"],
+    "CRITICAL": PALETTE["dark_red"],
+}
+
+
+def _spi_components(df: pd.DataFrame, matrix: dict = None) -> dict:
+    students = df.groupby("student_id").agg(
+        assessment_score=("assessment_score", "mean"),
+        attendance_rate=("attendance_rate", "mean"),
+        raised_hand_count=("raised_hand_count", "mean"),
+        class_level=("class_level", "first"),
+        student_name=("student_name", "first"),
+    )
 
+    # Student x course averages aligned to the students index, used for failed-course counts
+    if matrix is None:
+        matrix = course_matrix(df)
+    course_avg = matrix_rows(matrix, "score", students.index)
 
-def calculate_student_performance_index(student_data: pd.DataFrame, passing_score: int = PASSING_SCORE):
-    # Academic (60%)
-    avg_score = student_data["assessment_score"].mean()
-    academic_component = avg_score * 0.60
+    # Trend: first vs last assessment number, averaged across courses
+    by_assessment = df.groupby(["student_id", "assessment_no"])["assessment_score"].mean().groupby(level="student_id")
+    students["first_assessment_avg"] = by_assessment.first()
+    students["last_assessment_avg"] = by_assessment.last()
+    students["assessment_count"] = by_assessment.size()
 
-    # Attendance (25%)
-    avg_attendance = student_data["attendance_rate"].mean()
-    attendance_component = avg_attendance * 0.25
+    return {"students": students, "course_avg": course_avg}
 
-    # Engagement (15%) based on raised hands, normalized to 30
-    avg_engagement = student_data["raised_hand_count"].mean()
-    normalized_engagement = min((avg_engagement / 30) * 100, 100)
-    engagement_component = normalized_engagement * 0.15
 
-    base_spi = academic_component + attendance_component + engagement_component
+@st.cache_data
+def compute_spi_components(df: pd.DataFrame) -> dict:
+    return _spi_components(df, build_course_matrix(df))
 
-    # Penalty: failed courses
-    courses_perf = student_data.groupby("course_name")["assessment_score"].mean()
-    failed_courses = int((courses_perf < passing_score).sum())
 
-    if failed_courses == 1:
-        failure_penalty = 5
-    elif failed_courses >= 2:
-        failure_penalty = 10
-    else:
-        failure_penalty = 0
-
-    # Penalty: declining trend
-    assessment_scores = student_data.groupby("assessment_no")["assessment_score"].mean()
-    trend_penalty = 0
-    performance_change = 0.0
-
-    if len(assessment_scores) >= 2:
-        first_avg = float(assessment_scores.iloc[0])
-        last_avg = float(assessment_scores.iloc[-1])
-        performance_change = last_avg - first_avg
-
-        if performance_change < -10:
-            trend_penalty = 5
-
-    spi_score = base_spi - failure_penalty - trend_penalty
-    spi_score = max(0, min(100, spi_score))
-
-    # Status
-    if spi_score >= 80:
-        status, color = "EXCELLENT", PALETTE["dark_green"]
-    elif spi_score >= 65:
-        status, color = "SATISFACTORY", PALETTE["amber"]
-    elif spi_score >= 50:
-        status, color = "AT RISK", PALETTE["deep_orange"]
+def _status_index(spi_score: np.ndarray, model: SPIModel) -> np.ndarray:
+    # Index into model.statuses: cutoffs not met above the first band reached; NaN meets none -> floor_status
+    cutoffs = np.sort(np.array([cutoff for _, cutoff in model.status_thresholds], dtype=float))
+    status_idx = len(cutoffs) - np.searchsorted(cutoffs, spi_score, side="right")
+    status_idx[np.isnan(spi_score)] = len(cutoffs)
+    return status_idx
+
+
+def score_spi(components: dict, model: SPIModel, params: dict = None, status_only: bool = False) -> dict:
+    # Single SPI kernel. params optionally overrides numeric model settings with one value per
+    # scenario; results are then (scenarios, students) arrays, otherwise (students,) arrays.
+    # status_only skips the per-component detail arrays the what-if simulation does not need.
+    params = params or {}
+
+    def setting(name):
+        if name in params:
+            return np.asarray(params[name], dtype=float)[:, None]
+        return getattr(model, name)
+
+    students = components["students"]
+    academic_component = students["assessment_score"].to_numpy(dtype=float) * setting("academic_weight")
+    attendance_component = students["attendance_rate"].to_numpy(dtype=float) * setting("attendance_weight")
+    normalized_engagement = np.minimum(
+        students["raised_hand_count"].to_numpy(dtype=float) / setting("engagement_target") * 100, 100
+    )
+    engagement_component = normalized_engagement * setting("engagement_weight")
+    base_spi = academic_component + attendance_component + engagement_component
+
+    # Failed courses and their penalty only depend on the passing score, so work them out once per
+    # distinct value and expand to scenarios afterwards
+    course_avg = components["course_avg"]
+    if "passing_score" in params:
+        passing_scores, passing_idx = np.unique(np.asarray(params["passing_score"], dtype=float), return_inverse=True)
+        failed_courses = (course_avg[None, :, :] < passing_scores[:, None, None]).sum(axis=2)
     else:
-        status, color = "CRITICAL", PALETTE["dark_red"]
+        passing_idx = None
+        failed_courses = (course_avg < model.passing_score).sum(axis=1)
+
+    failure_penalty = np.zeros(failed_courses.shape, dtype=int)
+    for min_failed, penalty in sorted(model.failure_penalties):
+        failure_penalty = np.where(failed_courses >= min_failed, penalty, failure_penalty)
+    if passing_idx is not None:
+        failed_courses, failure_penalty = failed_courses[passing_idx], failure_penalty[passing_idx]
+
+    performance_trend = np.where(
+        students["assessment_count"].to_numpy() >= 2,
+        students["last_assessment_avg"].to_numpy(dtype=float) - students["first_assessment_avg"].to_numpy(dtype=float),
+        0.0,
+    )
+    trend_penalty = np.where(performance_trend < setting("trend_drop_threshold"), setting("trend_penalty"), 0)
 
-    details = {
+    spi_score = np.clip(base_spi - failure_penalty - trend_penalty, 0, 100)
+    status_idx = _status_index(spi_score, model)
+    if status_only:
+        return {"status_idx": status_idx}
+
+    return {
+        "spi_score": spi_score,
+        "status_idx": status_idx,
         "base_spi": base_spi,
         "academic_component": academic_component,
         "attendance_component": attendance_component,
@@ -63,34 +109,61 @@ def calculate_student_performance_index(student_data: pd.DataFrame, passing_scor
         "failure_penalty": failure_penalty,
         "trend_penalty": trend_penalty,
         "failed_courses": failed_courses,
-        "performance_trend": performance_change,
+        "performance_trend": performance_trend,
         "normalized_engagement": normalized_engagement,
     }
+
+
+@lru_cache(maxsize=16)
+def compile_spi_model(model: SPIModel):
+    statuses = np.asarray(model.statuses)
+
+    def score(components: dict) -> pd.DataFrame:
+        result = score_spi(components, model)
+        status_idx = result.pop("status_idx")
+        result = {"spi_score": result.pop("spi_score"), "status": statuses[status_idx], **result}
+        return pd.DataFrame(result, index=components["students"].index)
+
+    return score
+
+
+def calculate_student_performance_index(student_data: pd.DataFrame, passing_score: int = None, model: SPIModel = None):
+    model = model or active_spi_model()
+    if passing_score is not None and passing_score != model.passing_score:
+        model = replace(model, passing_score=passing_score)
+
+    scores = compile_spi_model(model)(_spi_components(student_data))
+    spi_score = float(scores["spi_score"].iloc[0])
+    status = scores["status"].iloc[0]
+    color = STATUS_COLORS.get(status, PALETTE["blue"])
+
+    details = {
+        key: scores[key].iloc[0].item()
+        for key in [
+            "base_spi",
+            "academic_component",
+            "attendance_component",
+            "engagement_component",
+            "failure_penalty",
+            "trend_penalty",
+            "failed_courses",
+            "performance_trend",
+            "normalized_engagement",
+        ]
+    }
     return spi_score, status, color, details
 
 
-def build_student_spi_table(df: pd.DataFrame) -> pd.DataFrame:
+def build_student_spi_table(df: pd.DataFrame, model: SPIModel = None) -> pd.DataFrame:
+    model = model or active_spi_model()
+    components = compute_spi_components(df)
+    scores = compile_spi_model(model)(components)
+
     student_avg = (
-        df.groupby("student_id")
-        .agg(
-            assessment_score=("assessment_score", "mean"),
-            attendance_rate=("attendance_rate", "mean"),
-            raised_hand_count=("raised_hand_count", "mean"),
-            class_level=("class_level", "first"),
-            student_name=("student_name", "first"),
-        )
+        components["students"][["assessment_score", "attendance_rate", "raised_hand_count", "class_level", "student_name"]]
+        .join(scores)
         .reset_index()
     )
-
-    spi_rows = []
-    for sid in student_avg["student_id"]:
-        sdata = df[df["student_id"] == sid]
-        spi_score, status, status_color, _ = calculate_student_performance_index(sdata, PASSING_SCORE)
-        spi_rows.append(
-            {"student_id": sid, "spi_score": spi_score, "status": status, "status_color": status_color}
-        )
-
-    spi_df = pd.DataFrame(spi_rows)
-    student_avg = student_avg.merge(spi_df, on="student_id", how="left")
-    student_avg["at_risk"] = student_avg["status"].isin(["AT RISK", "CRITICAL"])
+    student_avg["status_color"] = student_avg["status"].map(STATUS_COLORS).fillna(PALETTE["blue"])
+    student_avg["at_risk"] = student_avg["status"].isin(model.at_risk_statuses)
     return student_avg
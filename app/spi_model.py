@@ -0,0 +1,125 @@
+import json
+import os
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from numbers import Real
+import streamlit as st
+from app.config import PASSING_SCORE, SPI_MODEL_PATH
+
+
+def _freeze(value):
+    # JSON lists become tuples so the model stays hashable (it is the compile cache key)
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _is_pair(value, first_type) -> bool:
+    return (
+        isinstance(value, tuple) and len(value) == 2
+        and isinstance(value[0], first_type) and not isinstance(value[0], bool)
+        and _is_number(value[1])
+    )
+
+
+@dataclass(frozen=True)
+class SPIModel:
+    version: str = "default"
+
+    # Base components, weights should add up to 1
+    academic_weight: float = 0.60
+    attendance_weight: float = 0.25
+    engagement_weight: float = 0.15
+    engagement_target: float = 30  # raised hands counted as 100% engagement
+
+    # Penalties
+    passing_score: float = PASSING_SCORE
+    failure_penalties: tuple = ((1, 5), (2, 10))  # (min failed courses, penalty)
+    trend_drop_threshold: float = -10  # last - first assessment average
+    trend_penalty: float = 5
+
+    # Status bands, highest first; anything below the last band is floor_status
+    status_thresholds: tuple = (("EXCELLENT", 80), ("SATISFACTORY", 65), ("AT RISK", 50))
+    floor_status: str = "CRITICAL"
+    at_risk_statuses: tuple = ("AT RISK", "CRITICAL")
+
+    def __post_init__(self):
+        for f in fields(self):
+            object.__setattr__(self, f.name, _freeze(getattr(self, f.name)))
+
+        for name in ["academic_weight", "attendance_weight", "engagement_weight", "engagement_target",
+                     "passing_score", "trend_drop_threshold", "trend_penalty"]:
+            if not _is_number(getattr(self, name)):
+                raise ValueError(f"SPI model setting '{name}' must be a number")
+        for name in ["academic_weight", "attendance_weight", "engagement_weight", "trend_penalty"]:
+            if getattr(self, name) < 0:
+                raise ValueError(f"SPI model setting '{name}' must not be negative")
+        if self.engagement_target <= 0:
+            raise ValueError("SPI model setting 'engagement_target' must be positive")
+
+        if not isinstance(self.failure_penalties, tuple) or not all(
+            _is_pair(p, int) and p[0] >= 0 for p in self.failure_penalties
+        ):
+            raise ValueError("SPI model setting 'failure_penalties' must be a list of [min_failed, penalty] pairs")
+        if not isinstance(self.status_thresholds, tuple) or not all(
+            _is_pair(b, str) for b in self.status_thresholds
+        ):
+            raise ValueError("SPI model setting 'status_thresholds' must be a list of [name, cutoff] pairs")
+        if not isinstance(self.floor_status, str):
+            raise ValueError("SPI model setting 'floor_status' must be a string")
+        if not isinstance(self.at_risk_statuses, tuple) or not all(isinstance(s, str) for s in self.at_risk_statuses):
+            raise ValueError("SPI model setting 'at_risk_statuses' must be a list of status names")
+
+    @property
+    def statuses(self) -> list:
+        # Status names from the best band down to floor_status
+        bands = sorted(self.status_thresholds, key=lambda band: band[1], reverse=True)
+        return [name for name, _ in bands] + [self.floor_status]
+
+    @property
+    def at_risk_below(self) -> float:
+        # Lowest cutoff that still counts as not at risk
+        safe = [cutoff for name, cutoff in self.status_thresholds if name not in self.at_risk_statuses]
+        return min(safe) if safe else 100
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+DEFAULT_SPI_MODEL = SPIModel()
+
+
+def spi_model_from_dict(data: dict) -> SPIModel:
+    known = {f.name for f in fields(SPIModel)}
+    unknown = set(data) - known
+    if unknown:
+        raise ValueError(f"Unknown SPI model settings: {', '.join(sorted(unknown))}")
+    return SPIModel(**data)
+
+
+def load_spi_model(path: str) -> SPIModel:
+    with open(path, encoding="utf-8") as f:
+        return spi_model_from_dict(json.load(f))
+
+
+@lru_cache(maxsize=8)
+def _load_spi_model_cached(path: str, mtime: float):
+    # Failures are cached too, so a broken file is parsed once per edit rather than on every rerun
+    try:
+        return load_spi_model(path), None
+    except (OSError, ValueError, TypeError) as e:
+        return DEFAULT_SPI_MODEL, str(e)
+
+
+def active_spi_model(path: str = SPI_MODEL_PATH) -> SPIModel:
+    # Falls back to the built-in model when no file is configured; edits to the file are picked up on rerun
+    if not path or not os.path.exists(path):
+        return DEFAULT_SPI_MODEL
+    model, error = _load_spi_model_cached(path, os.path.getmtime(path))
+    if error:
+        st.warning(f"⚠️ Could not load SPI model from '{path}' ({error}). Using the default model.")
+    return model
@@ -1,6 +1,7 @@
 import streamlit as st
 from datetime import datetime
 from app.config import APP_TITLE
+from app.validation import VALIDATION_RULES
 
 
 def render_header():
@@ -24,3 +25,20 @@ def kpi_card(icon: str, label: str, value: str, card_class: str):
         """,
         unsafe_allow_html=True,
     )
+
+
+def render_validation_report(report: dict):
+    if report["flagged_rows"] == 0:
+        return
+
+    action = "excluded from" if report["quarantined"] else "kept in"
+    st.warning(
+        f"⚠️ {report['flagged_rows']} of {report['total_rows']} rows failed data validation "
+        f"and were {action} the analysis."
+    )
+    with st.expander("View data validation report"):
+        for rule, description in VALIDATION_RULES.items():
+            count = report["counts"][rule]
+            if count:
+                st.markdown(f"- **{description}**: {count} row(s)")
+        st.dataframe(report["bad_rows"], use_container_width=True)
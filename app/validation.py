@@ -0,0 +1,111 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+REQUIRED_COLUMNS = [
+    "student_id",
+    "student_name",
+    "class_level",
+    "course_name",
+    "assessment_no",
+    "assessment_score",
+    "attendance_rate",
+    "raised_hand_count",
+    "moodle_views",
+    "resources_downloads",
+]
+
+NUMERIC_COLUMNS = [
+    "assessment_no",
+    "assessment_score",
+    "attendance_rate",
+    "raised_hand_count",
+    "moodle_views",
+    "resources_downloads",
+]
+
+VALIDATION_RULES = {
+    "missing_key": "Missing student_id, course_name or assessment_no",
+    "score_out_of_range": "Assessment score missing or outside 0-100",
+    "attendance_out_of_range": "Attendance rate missing or outside 0-100",
+    "negative_activity": "Negative or missing raised hands, Moodle views or downloads",
+    "duplicate_assessment": "Repeated (student_id, course_name, assessment_no) row",
+    "inconsistent_class_level": "Class level differs from the student's usual class level, or has no clear majority",
+}
+
+
+def _rule_masks(df: pd.DataFrame) -> dict:
+    masks = {}
+
+    # Text keys are compared after the same whitespace stripping preprocess applies
+    courses = df["course_name"].astype("string").str.strip()
+    has_id = df["student_id"].notna().to_numpy()
+    masks["missing_key"] = ~has_id | (courses.isna() | (courses == "") | df["assessment_no"].isna()).to_numpy()
+
+    # between() is False for NaN, so missing values are flagged too
+    masks["score_out_of_range"] = ~df["assessment_score"].between(0, 100).to_numpy()
+    masks["attendance_out_of_range"] = ~df["attendance_rate"].between(0, 100).to_numpy()
+
+    activity = df[["raised_hand_count", "moodle_views", "resources_downloads"]].to_numpy(dtype=float)
+    masks["negative_activity"] = ~(activity >= 0).all(axis=1)
+
+    masks["duplicate_assessment"] = pd.DataFrame({
+        "student_id": df["student_id"],
+        "course_name": courses,
+        "assessment_no": df["assessment_no"],
+    }).duplicated(keep="first").to_numpy()
+
+    # Strict-majority class level per student; rows disagreeing with it are flagged, and a
+    # student whose rows are split evenly between levels has no majority, so all their rows are
+    levels = df["class_level"].astype(str).str.strip()
+    level_counts = (
+        pd.DataFrame({"student_id": df["student_id"], "class_level": levels})
+        .value_counts()
+        .reset_index(name="rows")
+    )
+    leaders = level_counts[level_counts["rows"] == level_counts.groupby("student_id")["rows"].transform("max")]
+    majority = leaders.drop_duplicates("student_id", keep=False).set_index("student_id")["class_level"]
+    masks["inconsistent_class_level"] = has_id & (levels.to_numpy() != df["student_id"].map(majority).to_numpy())
+
+    return masks
+
+
+@st.cache_data
+def validate_data(df: pd.DataFrame, quarantine: bool = True):
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Dataset is missing required columns: {', '.join(missing)}")
+
+    # A single non-numeric cell makes pandas read the whole column as text; coerce so such
+    # values become NaN and are caught by the range and activity rules
+    raw = df
+    df = df.copy()
+    for col in NUMERIC_COLUMNS:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    masks = _rule_masks(df)
+    flagged = np.column_stack([masks[rule] for rule in VALIDATION_RULES])
+    bad = flagged.any(axis=1)
+
+    bad_rows = raw[bad].copy()  # original values, so the report shows what was in the file
+    rule_names = np.array(list(VALIDATION_RULES))
+    bad_rows["issues"] = [", ".join(rule_names[row]) for row in flagged[bad]]
+
+    report = {
+        "total_rows": len(df),
+        "flagged_rows": int(bad.sum()),
+        "quarantined": quarantine,
+        "counts": {rule: int(masks[rule].sum()) for rule in VALIDATION_RULES},
+        "bad_rows": bad_rows,
+    }
+
+    if not quarantine:
+        return df, report
+
+    clean = df[~bad].reset_index(drop=True)
+    # A missing id turns the column into floats; once those rows are gone restore integer ids
+    ids = clean["student_id"]
+    if ids.dtype.kind == "f" and (ids == ids.round()).all():
+        clean["student_id"] = ids.astype("int64")
+    return clean, report
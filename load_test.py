@@ -0,0 +1,198 @@
+"""Headless load test for the dashboard.
+
+Runs main.py through Streamlit's AppTest against a synthetic dataset, with
+many simulated sessions running concurrently. Every rerun renders the whole
+app as a browser would: validation report, model resolution and all four
+tabs. Sessions interact through the app's own widgets, the Student Lookup
+selectbox and the What-If parameter inputs. Tab switches are client-side in
+Streamlit and cause no rerun, so they are not modelled. Concurrent sessions
+run in separate worker processes, each with its own copy of the data
+caches, so memory figures are an upper bound.
+
+    python load_test.py --students 2000 --sessions 40 --concurrency 8
+"""
+import argparse
+import multiprocessing as mp
+import os
+import random
+import resource
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+COURSES = ["Mathematics", "Science", "Biology", "Chemistry", "Computer"]
+CLASS_LEVELS = ["C1", "C2", "C3", "C4", "C5"]
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+APP_ERRORS = ("⚠️ Error:", "⚠️ An error occurred")
+
+
+def make_synthetic_dataset(n_students: int, n_assessments: int = 4, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    student_ids = np.arange(1000, 1000 + n_students)
+    n_rows = n_students * len(COURSES) * n_assessments
+
+    sid = np.repeat(student_ids, len(COURSES) * n_assessments)
+    ability = np.repeat(rng.normal(70, 10, n_students), len(COURSES) * n_assessments)
+    attendance = np.repeat(rng.uniform(60, 100, n_students), len(COURSES) * n_assessments)
+
+    return pd.DataFrame({
+        "student_id": sid,
+        "student_name": [f"Student_{s}" for s in sid],
+        "student_gender": np.repeat(rng.choice(["F", "M"], n_students), len(COURSES) * n_assessments),
+        "class_level": np.repeat(rng.choice(CLASS_LEVELS, n_students), len(COURSES) * n_assessments),
+        "course_name": np.tile(np.repeat(COURSES, n_assessments), n_students),
+        "assessment_no": np.tile(np.arange(1, n_assessments + 1), n_students * len(COURSES)),
+        "assessment_score": np.clip(ability + rng.normal(0, 12, n_rows), 0, 100).round().astype(int),
+        "raised_hand_count": rng.integers(0, 21, n_rows),
+        "moodle_views": rng.integers(0, 51, n_rows),
+        "attendance_rate": np.clip(attendance + rng.normal(0, 5, n_rows), 0, 100).round().astype(int),
+        "resources_downloads": rng.integers(0, 21, n_rows),
+    })
+
+
+def run_session(student_ids: list, lookups: int, edits: int, seed: int, timeout: float) -> dict:
+    rng = random.Random(seed)
+    timings = []
+
+    def step(name, action):
+        start = time.perf_counter()
+        at = action()
+        timings.append((name, time.perf_counter() - start))
+        # main.py turns exceptions into st.error banners; the Risk tab uses st.error for content too
+        failures = [e.value for e in at.exception] + [e.value for e in at.error if e.value.startswith(APP_ERRORS)]
+        if failures:
+            raise RuntimeError(f"{name} failed: {failures[0]}")
+        return at
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    step("open_app", at.run)
+
+    for _ in range(lookups):
+        student = str(rng.choice(student_ids))
+        step("select_student", lambda: at.selectbox[0].select(student).run())
+
+    # What-If edits: a small passing-score grid, like a user comparing a few cut-offs
+    for _ in range(edits):
+        values = ", ".join(str(v) for v in sorted(rng.sample(range(50, 71, 5), 2)))
+        step("whatif_edit", lambda: at.text_input(key="sim_passing_score").input(values).run())
+
+    return {"timings": timings}
+
+
+def _percentiles(values) -> dict:
+    arr = np.asarray(values) * 1000
+    return {
+        "count": len(arr),
+        "p50_ms": np.percentile(arr, 50),
+        "p90_ms": np.percentile(arr, 90),
+        "p95_ms": np.percentile(arr, 95),
+        "p99_ms": np.percentile(arr, 99),
+        "max_ms": arr.max(),
+    }
+
+
+def _rss_mb() -> float:
+    # Current resident set size; falls back to the peak where /proc is unavailable
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / (1024 * 1024) if os.uname().sysname == "Darwin" else rss / 1024
+
+
+def run_worker(csv_path: str, student_ids: list, seeds: list, lookups: int, edits: int, timeout: float) -> dict:
+    # Point the app at the synthetic dataset before it is first imported in this process
+    os.environ["STUDENTS_CSV_PATH"] = csv_path
+
+    # Warm this process's caches once so the numbers reflect steady-state sessions
+    run_session(student_ids, 1, 1, -1, timeout)
+
+    timings, rss_growth = [], []
+    start = time.time()
+    for seed in seeds:
+        before = _rss_mb()
+        timings.extend(run_session(student_ids, lookups, edits, seed, timeout)["timings"])
+        rss_growth.append(_rss_mb() - before)
+    end = time.time()
+
+    return {"timings": timings, "rss_growth": rss_growth, "rss_mb": _rss_mb(), "start": start, "end": end}
+
+
+def run_load_test(n_students: int, sessions: int, concurrency: int, lookups: int, edits: int, timeout: float,
+                  seed: int):
+    df = make_synthetic_dataset(n_students, seed=seed)
+    student_ids = df["student_id"].unique().tolist()
+
+    # AppTest drives a process-wide Streamlit runtime, so each concurrent session slot is its own process
+    seeds = [seed + i for i in range(sessions)]
+    batches = [seeds[i::concurrency] for i in range(concurrency) if seeds[i::concurrency]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "synthetic_students.csv")
+        df.to_csv(csv_path, index=False)
+
+        with ProcessPoolExecutor(max_workers=len(batches), mp_context=mp.get_context("spawn")) as pool:
+            futures = [
+                pool.submit(run_worker, csv_path, student_ids, batch, lookups, edits, timeout)
+                for batch in batches
+            ]
+            results = [f.result() for f in futures]
+
+    elapsed = max(r["end"] for r in results) - min(r["start"] for r in results)
+
+    by_step = defaultdict(list)
+    for result in results:
+        for name, seconds in result["timings"]:
+            by_step[name].append(seconds)
+    all_timings = [s for values in by_step.values() for s in values]
+    rss_growth = [mb for result in results for mb in result["rss_growth"]]
+
+    latency = pd.DataFrame({name: _percentiles(values) for name, values in by_step.items()}).T
+    latency.loc["all"] = _percentiles(all_timings)
+
+    summary = {
+        "rows": len(df),
+        "students": n_students,
+        "sessions": sessions,
+        "concurrency": len(batches),
+        "interactions": len(all_timings),
+        "wall_time_s": elapsed,
+        "sessions_per_s": sessions / elapsed,
+        "interactions_per_s": len(all_timings) / elapsed,
+        "worker_rss_mb": float(np.mean([r["rss_mb"] for r in results])),
+        "rss_growth_per_session_mb": float(np.mean(rss_growth)),
+    }
+    return summary, latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard sessions headlessly.")
+    parser.add_argument("--students", type=int, default=1000, help="synthetic students in the dataset")
+    parser.add_argument("--sessions", type=int, default=20, help="total simulated sessions")
+    parser.add_argument("--concurrency", type=int, default=4, help="sessions running at the same time (worker processes)")
+    parser.add_argument("--lookups", type=int, default=3, help="student selections per session")
+    parser.add_argument("--edits", type=int, default=1, help="What-If parameter edits per session")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per interaction")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    summary, latency = run_load_test(
+        args.students, args.sessions, args.concurrency, args.lookups, args.edits, args.timeout, args.seed
+    )
+
+    print("Load test summary")
+    for key, value in summary.items():
+        print(f"  {key:<38} {value:,.2f}" if isinstance(value, float) else f"  {key:<38} {value:,}")
+    print()
+    print("Latency per interaction")
+    print(latency.round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
 import streamlit as st
 
-from app.config import APP_TITLE
+from app.config import APP_TITLE, QUARANTINE_INVALID_ROWS
 from app.styles import inject_css
 from app.data import load_data, preprocess
-from app.ui import render_header
+from app.validation import validate_data
+from app.spi_model import active_spi_model
+from app.ui import render_header, render_validation_report
 from app.pages.overview import render_overview
 from app.pages.risk import render_risk
 from app.pages.student_lookup import render_student_lookup
+from app.pages.simulation import render_simulation
 
 
 def main():
@@ -15,22 +18,30 @@ def main():
 
     # Load + prepare data once
     df = load_data()
+    df, validation_report = validate_data(df, QUARANTINE_INVALID_ROWS)
     df = preprocess(df)
 
     # Global header
     render_header()
+    render_validation_report(validation_report)
+    spi_model = active_spi_model()
     
     # Tabs navigation
-    tab_overview, tab_risk, tab_lookup = st.tabs(["📊 Overview", "⚠️ Risk", "🔎 Student Lookup"])
+    tab_overview, tab_risk, tab_lookup, tab_simulation = st.tabs(
+        ["📊 Overview", "⚠️ Risk", "🔎 Student Lookup", "🧪 What-If"]
+    )
 
     with tab_overview:
-        render_overview(df, show_header=False)
+        render_overview(df, show_header=False, spi_model=spi_model)
 
     with tab_risk:
-        render_risk(df)
+        render_risk(df, spi_model)
 
     with tab_lookup:
-        render_student_lookup(df)
+        render_student_lookup(df, spi_model)
+
+    with tab_simulation:
+        render_simulation(df, spi_model)
 
 
 if __name__ == "__main__":